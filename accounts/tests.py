@@ -1,3 +1,6 @@
+from unittest import mock
+
+from django.db import DatabaseError
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
@@ -43,6 +46,16 @@ class UserModelTests(TestCase):
         self.assertTrue(user.is_staff)
         self.assertTrue(user.is_superuser)
 
+    def test_create_user_rolled_back_when_default_categories_fail(self):
+        """Test that a failed default category insert leaves no user behind"""
+        from notes.models import Category
+
+        with mock.patch.object(Category.objects, 'bulk_create', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                User.objects.create_user('test@example.com', 'testpass123')
+
+        self.assertFalse(User.objects.filter(email='test@example.com').exists())
+
 
 class AuthenticationAPITests(TestCase):
     """Test authentication endpoints"""
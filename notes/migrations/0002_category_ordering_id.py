@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='category',
+            options={'ordering': ['created_at', 'id'], 'verbose_name_plural': 'Categories'},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0002_category_ordering_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'category', '-updated_at'], name='note_user_cat_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', '-updated_at'], name='note_user_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0003_note_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(fields=['user', 'created_at', 'id'], name='cat_user_created_idx'),
+        ),
+    ]
@@ -15,7 +15,10 @@ class Category(models.Model):
     class Meta:
         verbose_name_plural = 'Categories'
         unique_together = ['name', 'user']
-        ordering = ['created_at']
+        ordering = ['created_at', 'id']
+        indexes = [
+            models.Index(fields=['user', 'created_at', 'id'], name='cat_user_created_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -40,6 +43,10 @@ class Note(models.Model):
 
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['user', 'category', '-updated_at'], name='note_user_cat_updated_idx'),
+            models.Index(fields=['user', '-updated_at'], name='note_user_updated_idx'),
+        ]
 
     def __str__(self):
         return self.title or f'Note {self.id}'
@@ -3,26 +3,51 @@ from .models import Category, Note
 
 
 class CategorySerializer(serializers.ModelSerializer):
-    notes_count = serializers.SerializerMethodField()
+    # Annotated on the queryset by CategoryViewSet
+    notes_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Category
         fields = ('id', 'name', 'color', 'notes_count')
         read_only_fields = ('id',)
 
-    def get_notes_count(self, obj):
-        return obj.notes.count()
+
+class CategoryDisplayField(serializers.CharField):
+    """Read-only category attribute, filled in by NoteSerializer.to_representation."""
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        # Left as None here so the category is only read once per note
+        return None
 
 
 class NoteSerializer(serializers.ModelSerializer):
-    category_name = serializers.CharField(source='category.name', read_only=True)
-    category_color = serializers.CharField(source='category.color', read_only=True)
+    category_name = CategoryDisplayField()
+    category_color = CategoryDisplayField()
 
     class Meta:
         model = Note
         fields = ('id', 'title', 'content', 'category', 'category_name', 'category_color', 'created_at', 'updated_at')
         read_only_fields = ('id', 'created_at', 'updated_at', 'category_name', 'category_color')
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # The category is joined by NoteViewSet.get_queryset; read it once
+        # and fill both display fields in place
+        category = instance.category
+        if category is not None:
+            data['category_name'] = category.name
+            data['category_color'] = category.color
+        return data
+
+
+class NoteListSerializer(NoteSerializer):
+    class Meta(NoteSerializer.Meta):
+        fields = ('id', 'title', 'category', 'category_name', 'category_color', 'created_at', 'updated_at')
+
 
 class NoteCreateSerializer(serializers.ModelSerializer):
     class Meta:
@@ -5,21 +5,20 @@ from .models import Category
 
 User = get_user_model()
 
-# Default categories with their colors
-DEFAULT_CATEGORIES = [
-    {'name': 'Random Thoughts', 'color': '#EF9C66'},
-    {'name': 'School', 'color': '#FCDC94'},
-    {'name': 'Personal', 'color': '#C8CFA0'},
-]
+# Default categories as (name, color) pairs
+DEFAULT_CATEGORIES = (
+    ('Random Thoughts', '#EF9C66'),
+    ('School', '#FCDC94'),
+    ('Personal', '#C8CFA0'),
+)
 
 
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=User, dispatch_uid='create_default_categories')
 def create_default_categories(sender, instance, created, **kwargs):
     """Create default categories when a new user is created."""
     if created:
-        for category_data in DEFAULT_CATEGORIES:
-            Category.objects.create(
-                name=category_data['name'],
-                color=category_data['color'],
-                user=instance
-            )
+        # unique_together on (name, user) makes a replayed signal a no-op
+        Category.objects.bulk_create([
+            Category(name=name, color=color, user=instance)
+            for name, color in DEFAULT_CATEGORIES
+        ], ignore_conflicts=True)
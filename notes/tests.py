@@ -11,8 +11,9 @@ User = get_user_model()
 class CategoryModelTests(TestCase):
     """Test Category model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
@@ -38,8 +39,10 @@ class CategoryModelTests(TestCase):
         )
 
         # Initially no notes - check via API
+        from django.db.models import Count
         from .serializers import CategorySerializer
-        serializer = CategorySerializer(category)
+        categories = Category.objects.annotate(notes_count=Count('notes'))
+        serializer = CategorySerializer(categories.get(id=category.id))
         self.assertEqual(serializer.data['notes_count'], 0)
 
         # Create notes
@@ -57,20 +60,21 @@ class CategoryModelTests(TestCase):
         )
 
         # Check via serializer again
-        serializer = CategorySerializer(category)
+        serializer = CategorySerializer(categories.get(id=category.id))
         self.assertEqual(serializer.data['notes_count'], 2)
 
 
 class NoteModelTests(TestCase):
     """Test Note model"""
 
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
         # Get one of the default categories instead of creating "Personal"
-        self.category = Category.objects.filter(user=self.user).first()
+        cls.category = Category.objects.filter(user=cls.user).first()
 
     def test_create_note(self):
         """Test creating a note"""
@@ -114,12 +118,15 @@ class NoteModelTests(TestCase):
 class CategoryAPITests(TestCase):
     """Test Category API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
+
+    def setUp(self):
+        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_categories(self):
@@ -131,7 +138,30 @@ class CategoryAPITests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Should include default categories + created ones
-        self.assertGreaterEqual(len(response.data), 2)
+        self.assertGreaterEqual(len(response.data['results']), 2)
+
+    def test_retrieve_categories_notes_count_single_query(self):
+        """Test notes_count is annotated instead of counted per category"""
+        for category in Category.objects.filter(user=self.user):
+            Note.objects.create(user=self.user, category=category, title='Note')
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/categories/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for category in response.data['results']:
+            self.assertEqual(category['notes_count'], 1)
+
+    def test_retrieve_category_notes_count_single_query(self):
+        """Test the detail view also reads the annotated notes_count"""
+        category = Category.objects.filter(user=self.user).first()
+        Note.objects.create(user=self.user, category=category, title='Note')
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/categories/{category.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['notes_count'], 1)
 
     def test_categories_limited_to_user(self):
         """Test that categories are limited to authenticated user"""
@@ -147,7 +177,7 @@ class CategoryAPITests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Check that other user's category is not included
-        category_names = [cat['name'] for cat in response.data]
+        category_names = [cat['name'] for cat in response.data['results']]
         self.assertIn('User1 Category', category_names)
         self.assertNotIn('User2 Category', category_names)
 
@@ -161,6 +191,7 @@ class CategoryAPITests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], payload['name'])
         self.assertEqual(response.data['color'], payload['color'])
+        self.assertEqual(response.data['notes_count'], 0)
         
         # Check category was created
         new_count = Category.objects.filter(user=self.user).count()
@@ -177,15 +208,18 @@ class CategoryAPITests(TestCase):
 class NoteAPITests(TestCase):
     """Test Note API endpoints"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             email='test@example.com',
             password='testpass123'
         )
-        self.client.force_authenticate(user=self.user)
         # Get one of the default categories
-        self.category = Category.objects.filter(user=self.user).first()
+        cls.category = Category.objects.filter(user=cls.user).first()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
 
     def test_retrieve_notes(self):
         """Test retrieving a list of notes"""
@@ -202,10 +236,58 @@ class NoteAPITests(TestCase):
             content='Content 2'
         )
 
-        response = self.client.get('/api/notes/')
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/notes/')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(response.data['results'][0]['category_name'], self.category.name)
+
+    def test_retrieve_notes_summary(self):
+        """Test that ?fields=summary lists notes without their content"""
+        Note.objects.create(
+            user=self.user,
+            category=self.category,
+            title='Note 1',
+            content='Content 1'
+        )
+
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/notes/?fields=summary')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'Note 1')
+        self.assertEqual(response.data['results'][0]['category_name'], self.category.name)
+        self.assertNotIn('content', response.data['results'][0])
+
+    def test_retrieve_note_without_category(self):
+        """Test that a note without a category has empty category info"""
+        note = Note.objects.create(user=self.user, category=None, title='Note')
+
+        response = self.client.get(f'/api/notes/{note.id}/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data['category_name'])
+        self.assertIsNone(response.data['category_color'])
+
+    def test_note_response_shape(self):
+        """Test that note responses keep their keys with and without a category"""
+        expected_keys = [
+            'id', 'title', 'content', 'category', 'category_name',
+            'category_color', 'created_at', 'updated_at'
+        ]
+        with_category = Note.objects.create(user=self.user, category=self.category, title='Note')
+        without_category = Note.objects.create(user=self.user, category=None, title='Note')
+
+        for note in (with_category, without_category):
+            response = self.client.get(f'/api/notes/{note.id}/')
+            self.assertEqual(list(response.data), expected_keys)
+
+        response = self.client.options(f'/api/notes/{with_category.id}/')
+        put_fields = response.data['actions']['PUT']
+        self.assertTrue(put_fields['category_name']['read_only'])
+        self.assertTrue(put_fields['category_color']['read_only'])
 
     def test_filter_notes_by_category(self):
         """Test filtering notes by category"""
@@ -229,8 +311,22 @@ class NoteAPITests(TestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'Work Note')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'Work Note')
+
+    def test_filter_notes_by_invalid_category(self):
+        """Test that a non-numeric category filter matches no notes"""
+        Note.objects.create(
+            user=self.user,
+            category=self.category,
+            title='Note'
+        )
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/notes/?category=abc')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 0)
 
     def test_notes_limited_to_user(self):
         """Test that notes are limited to authenticated user"""
@@ -254,8 +350,8 @@ class NoteAPITests(TestCase):
         response = self.client.get('/api/notes/')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['title'], 'User1 Note')
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], 'User1 Note')
 
     def test_create_note(self):
         """Test creating a new note"""
@@ -305,6 +401,8 @@ class NoteAPITests(TestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], payload['title'])
+        self.assertEqual(response.data['category_name'], self.category.name)
         note.refresh_from_db()
         self.assertEqual(note.title, payload['title'])
         self.assertEqual(note.content, payload['content'])
@@ -327,6 +425,7 @@ class NoteAPITests(TestCase):
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['category_name'], new_category.name)
         note.refresh_from_db()
         self.assertEqual(note.category, new_category)
 
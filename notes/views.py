@@ -1,9 +1,11 @@
+from functools import cached_property
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
+from django.db.models import Count
 from .models import Category, Note
-from .serializers import CategorySerializer, NoteSerializer, NoteCreateSerializer
+from .serializers import CategorySerializer, NoteSerializer, NoteListSerializer, NoteCreateSerializer
 
 
 class CategoryViewSet(viewsets.ModelViewSet):
@@ -11,51 +13,66 @@ class CategoryViewSet(viewsets.ModelViewSet):
     serializer_class = CategorySerializer
 
     def get_queryset(self):
-        return Category.objects.filter(user=self.request.user)
+        # Meta.ordering is not applied to GROUP BY queries, so restate it
+        return Category.objects.filter(user=self.request.user).annotate(
+            notes_count=Count('notes')
+        ).order_by(*Category._meta.ordering)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        category = serializer.save(user=self.request.user)
+        # A category that was just created cannot have notes yet
+        category.notes_count = 0
 
 
 class NoteViewSet(viewsets.ModelViewSet):
     permission_classes = (IsAuthenticated,)
+    serializer_class_map = {
+        'create': NoteCreateSerializer,
+    }
+
+    @cached_property
+    def summary_requested(self):
+        # ?fields=summary lists notes without their content
+        return self.action == 'list' and self.request.query_params.get('fields') == 'summary'
 
     def get_serializer_class(self):
-        if self.action == 'create':
-            return NoteCreateSerializer
-        return NoteSerializer
+        if self.summary_requested:
+            return NoteListSerializer
+        return self.serializer_class_map.get(self.action, NoteSerializer)
 
     def get_queryset(self):
-        queryset = Note.objects.filter(user=self.request.user)
+        queryset = Note.objects.filter(user=self.request.user).select_related('category')
         
         # Filter by category if provided
         category_id = self.request.query_params.get('category')
         if category_id:
-            queryset = queryset.filter(category_id=category_id)
+            try:
+                queryset = queryset.filter(category_id=int(category_id))
+            except ValueError:
+                # A non-numeric id cannot match any category
+                queryset = queryset.none()
+
+        if self.summary_requested:
+            queryset = queryset.only(
+                'id', 'title', 'category', 'created_at', 'updated_at',
+                'category__name', 'category__color'
+            )
         
         return queryset
 
+    @cached_property
+    def default_category(self):
+        # The first category (Random Thoughts), looked up once per request
+        return Category.objects.filter(user=self.request.user).first()
+
     def perform_create(self, serializer):
-        # Get the first category (Random Thoughts) as default
-        default_category = Category.objects.filter(user=self.request.user).first()
-        serializer.save(user=self.request.user, category=default_category)
+        serializer.save(user=self.request.user, category=self.default_category)
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
         
-        # Return full note data with category info
-        note = Note.objects.get(id=serializer.instance.id)
-        return Response(NoteSerializer(note).data, status=status.HTTP_201_CREATED)
-
-    def update(self, request, *args, **kwargs):
-        partial = kwargs.pop('partial', False)
-        instance = self.get_object()
-        serializer = NoteCreateSerializer(instance, data=request.data, partial=partial)
-        serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
-
-        # Return full note data with category info
-        note = Note.objects.get(id=instance.id)
-        return Response(NoteSerializer(note).data)
+        # Return full note data with category info; the category was
+        # assigned as an instance in perform_create, so no refetch is needed
+        return Response(NoteSerializer(serializer.instance).data, status=status.HTTP_201_CREATED)
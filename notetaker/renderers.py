@@ -0,0 +1,50 @@
+"""
+JSON renderer for the notetaker API backed by orjson.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# Reuse DRF's handling of lazy strings, Decimals, UUIDs, querysets etc.
+_default = JSONRenderer.encoder_class().default
+
+LINE_SEPARATOR = b'\xe2\x80\xa8'  # U+2028 in UTF-8
+PARAGRAPH_SEPARATOR = b'\xe2\x80\xa9'  # U+2029 in UTF-8
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson.
+
+    Indented, non-compact or ASCII-only output and integers wider than 64
+    bits are handed to JSONRenderer. No serializer in this API produces
+    floats, so NaN and infinity are not checked for; orjson writes them as
+    null.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if (
+            self.get_indent(accepted_media_type, renderer_context) is not None
+            or not self.compact
+            or self.ensure_ascii
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Match JSONRenderer, which escapes these to stay a javascript subset.
+        # Both start with 0xE2, and a single-byte scan for it is much cheaper
+        # than searching for either separator.
+        if b'\xe2' in ret:
+            if LINE_SEPARATOR in ret:
+                ret = ret.replace(LINE_SEPARATOR, b'\\u2028')
+            if PARAGRAPH_SEPARATOR in ret:
+                ret = ret.replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
@@ -0,0 +1,71 @@
+import json
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from notes.models import Category, Note
+from .renderers import ORJSONRenderer
+
+User = get_user_model()
+
+
+class ORJSONRendererTests(TestCase):
+    """Test the orjson-backed JSON renderer"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123'
+        )
+        Note.objects.create(
+            user=cls.user,
+            category=Category.objects.filter(user=cls.user).first(),
+            title='Café',
+            content='Line\u2028separated'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_response_matches_data(self):
+        """Test that a list response parses back to the serialized data"""
+        response = self.client.get('/api/notes/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(json.loads(response.content), response.data)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_accept_indent(self):
+        """Test that an indent requested in the Accept header is honoured"""
+        accept = 'application/json; indent=4'
+        response = self.client.get('/api/categories/', HTTP_ACCEPT=accept)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(b'\n    "count"', response.content)
+        self.assertEqual(response.content, JSONRenderer().render(response.data, accept))
+
+    def test_browsable_api(self):
+        """Test that the browsable API renders indented JSON"""
+        response = self.client.get('/api/notes/', HTTP_ACCEPT='text/html')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+        self.assertContains(response, '&quot;title&quot;: &quot;Café&quot;')
+
+    def test_text_without_separators_unchanged(self):
+        """Test that other characters sharing the separators' lead byte render as-is"""
+        data = {'value': 'It\u2019s \u2014 done'}
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_large_integer(self):
+        """Test that integers wider than 64 bits still render"""
+        data = {'value': 2 ** 70}
+
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))